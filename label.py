@@ -3,55 +3,132 @@
 Generate 3D printable toolbox labels.
 """
 
-import sys
+import hashlib
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from importlib.metadata import version
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple, TYPE_CHECKING
 import typer
 from rich import print as rprint
 import re
-from build123d import Face
+
+if TYPE_CHECKING:
+    from build123d import Face
+    from OCP.TopoDS import TopoDS_Shape
+    from src.label_generator.label_builder import LabelBuilder
 
 app = typer.Typer(add_completion=False)
 
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]+')
+
+PROFILE_CACHE_DIR = Path.home() / ".cache" / "husky-toolbox-labels"
+# Bump whenever profile loading or scaling changes, to invalidate old pickles
+PROFILE_CACHE_VERSION = 1
+
 def sanitize_filename(text: str) -> str:
     """Convert text to a safe filename (lowercase, snake_case)."""
     # Replace non-alphanumeric characters with underscores
-    s = re.sub(r'[^a-zA-Z0-9]+', '_', text)
+    s = _NON_ALNUM_RE.sub('_', text)
     # Convert to lowercase
     s = s.lower()
     # Remove leading/trailing underscores
     s = s.strip('_')
     return s if s else "label"
 
+@lru_cache(maxsize=None)
+def load_profile_face(profile_path: Path) -> "Face":
+    """
+    Load and scale the clip profile once per process.
+
+    The scaled face is also pickled to PROFILE_CACHE_DIR, so later runs skip
+    the SVG import entirely. The cache key covers the SVG contents, the
+    target size, PROFILE_CACHE_VERSION and the build123d version.
+    """
+    from src.label_generator.svg_profile import ClipProfile
+
+    digest = hashlib.sha1(profile_path.read_bytes())
+    digest.update(repr((
+        PROFILE_CACHE_VERSION,
+        version("build123d"),
+        ClipProfile.TARGET_HEIGHT,
+    )).encode())
+    cache_path = PROFILE_CACHE_DIR / f"{digest.hexdigest()}.pkl"
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # Unreadable cache entry, rebuild it below
+            pass
+
+    clip_profile = ClipProfile(profile_path)
+    clip_profile.load().scale_to_dimensions()
+    profile_face = clip_profile.scaled_face
+
+    try:
+        PROFILE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(profile_face, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Caching is best effort
+        pass
+
+    return profile_face
+
+def build_label(
+    text_content: str,
+    profile_path: Path,
+    font_path: Path
+) -> "LabelBuilder":
+    """Build the body and text insert for a single label."""
+    from src.label_generator.kerned_text import load_font_context
+    from src.label_generator.text_geometry import LabelText
+    from src.label_generator.label_builder import LabelBuilder
+
+    profile_face = load_profile_face(profile_path)
+    font_ctx = load_font_context(font_path)
+
+    # Create text
+    text_obj = LabelText(text_content, font_ctx)
+    text_obj.create_text()
+
+    # Build label
+    builder = LabelBuilder(
+        profile_face,
+        text_obj.text_geometry,
+        text_obj.get_label_width(),
+        text_is_clean=text_obj.text_is_clean
+    )
+    builder.build_body().add_text_recess().create_text_insert()
+    return builder
+
 def generate_single_label(
     text_content: str,
     output_path: Path,
-    profile_face: Face,
+    profile_path: Path,
+    font_path: Path,
     output_format: str
 ) -> bool:
     """
     Generate a single label.
+
+    Takes file paths rather than loaded objects so it can run in a worker
+    process; the profile and font are cached per process.
     Returns True if successful, False otherwise.
     """
     try:
-        from src.label_generator.svg_profile import ClipProfile
-        from src.label_generator.text_geometry import LabelText
-        from src.label_generator.label_builder import LabelBuilder
         from src.label_generator.exporter import LabelExporter
 
         rprint(f"Generating label: [bold cyan]\"{text_content}\"[/bold cyan]")
 
-        # Create text
-        text_obj = LabelText(text_content)
-        text_obj.create_text()
-        
-        # Build label
-        builder = LabelBuilder(
-            profile_face,
-            text_obj.text_geometry,
-            text_obj.get_label_width()
-        )
-        builder.build_body().add_text_recess().create_text_insert()
+        builder = build_label(text_content, profile_path, font_path)
 
         # Export
         exporter = LabelExporter(builder.label_body, builder.text_insert)
@@ -71,6 +148,27 @@ def generate_single_label(
         # traceback.print_exc()
         return False
 
+def build_batch_label(
+    text_content: str,
+    profile_path: Path,
+    font_path: Path
+) -> Optional[Tuple["TopoDS_Shape", "TopoDS_Shape"]]:
+    """
+    Build a label for an aggregated batch without exporting it.
+
+    Returns the raw OCCT shapes of (label_body, text_insert), or None if the
+    label failed. Parts carry boolean operation history that cannot be
+    pickled back to the parent process; the bare TopoDS shapes can.
+    """
+    try:
+        rprint(f"Generating label: [bold cyan]\"{text_content}\"[/bold cyan]")
+        builder = build_label(text_content, profile_path, font_path)
+        return builder.label_body.wrapped, builder.text_insert.wrapped
+
+    except Exception as e:
+        rprint(f"[bold red]Error generating label \"{text_content}\":[/bold red] {e}")
+        return None
+
 @app.command()
 def main(
     text: Optional[str] = typer.Argument(None, help="Text to display on the label (optional if using --file)"),
@@ -78,7 +176,9 @@ def main(
     output: Path = typer.Option(Path("label.step"), "--output", "-o", help="Output file path (for single label mode)"),
     output_dir: Path = typer.Option(Path("labels_out"), "--output-dir", help="Output directory (for batch mode)"),
     profile: Path = typer.Option(Path("cross-section.svg"), help="SVG file with clip cross-section"),
+    font: Path = typer.Option(Path("InterVariable.ttf"), "--font", help="TTF/OTF font file for the label text"),
     format: str = typer.Option("step", "--format", "-f", help="Output format: step or stl"),
+    aggregate: bool = typer.Option(False, "--aggregate", help="Batch mode: write all labels into one STEP file"),
 ):
     """
     Generate 3D printable toolbox labels.
@@ -86,22 +186,31 @@ def main(
     You can provide a single text argument to generate one label,
     or use --file to generate multiple labels from a text file.
     """
-    from src.label_generator.svg_profile import ClipProfile
-
     if not profile.exists():
         rprint(f"[bold red]Error:[/bold red] Profile file not found: {profile}")
         raise typer.Exit(code=1)
 
+    if not font.exists():
+        rprint(f"[bold red]Error:[/bold red] Font file not found: {font}")
+        raise typer.Exit(code=1)
+
     try:
         # Load and scale profile once
         rprint(f"Loading profile from {profile}...")
-        clip_profile = ClipProfile(profile)
-        clip_profile.load().scale_to_dimensions()
-        profile_face = clip_profile.scaled_face
+        load_profile_face(profile)
     except Exception as e:
         rprint(f"[bold red]Error loading profile:[/bold red] {e}")
         raise typer.Exit(code=1)
 
+    try:
+        # Load font once and share it between all labels
+        from src.label_generator.kerned_text import load_font_context
+
+        load_font_context(font)
+    except Exception as e:
+        rprint(f"[bold red]Error loading font:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
     
     if file:
         # Batch mode
@@ -110,8 +219,7 @@ def main(
             raise typer.Exit(code=1)
             
         try:
-            with open(file, 'r') as f:
-                lines = [line.strip() for line in f if line.strip()]
+            lines = [line.strip() for line in file.read_text().splitlines() if line.strip()]
         except Exception as e:
             rprint(f"[bold red]Error reading file:[/bold red] {e}")
             raise typer.Exit(code=1)
@@ -120,28 +228,94 @@ def main(
             rprint("[yellow]Warning:[/yellow] Input file is empty.")
             return
 
+        if aggregate and format != "step":
+            rprint("[bold red]Error:[/bold red] --aggregate is only supported for STEP output.")
+            raise typer.Exit(code=1)
+
         # Create output directory
         output_dir.mkdir(parents=True, exist_ok=True)
         rprint(f"Processing [bold]{len(lines)}[/bold] labels from {file} into {output_dir}/...")
 
+        # Labels are independent and CPU-bound, so build them in parallel
+        # processes. Workers load the profile and font themselves; there is
+        # no point starting more workers than there are labels.
+        max_workers = min(os.cpu_count() or 1, len(lines))
+
+        if aggregate:
+            from build123d import Part
+            from src.label_generator.exporter import export_batch_step
+
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(build_batch_label, line, profile, font)
+                    for line in lines
+                ]
+                results = []
+                for line, future in zip(lines, futures):
+                    try:
+                        results.append(future.result())
+                    except BrokenProcessPool:
+                        # A worker died (e.g. crashed in OCCT); count the label as failed
+                        rprint(f"[bold red]Error generating label \"{line}\":[/bold red] worker process terminated")
+                        results.append(None)
+
+            labels = [
+                # Rewrap the raw shapes returned by the workers
+                (sanitize_filename(line), Part(parts[0]), Part(parts[1]))
+                for line, parts in zip(lines, results)
+                if parts is not None
+            ]
+            if not labels:
+                rprint("[bold red]Error:[/bold red] No labels were generated.")
+                raise typer.Exit(code=1)
+
+            batch_output_path = output_dir / f"{sanitize_filename(file.stem)}.step"
+            export_batch_step(labels, batch_output_path)
+
+            file_size = batch_output_path.stat().st_size / 1024
+            rprint(f"  [green]✓[/green] Exported to: {batch_output_path} ({file_size:.1f} KB)")
+            rprint(f"\n[bold green]Batch processing complete![/bold green] ({len(labels)}/{len(lines)} successful)")
+            return
+
         success_count = 0
-        for line in lines:
-            safe_name = sanitize_filename(line)
-            # Determine extension based on format. STL export creates multiple files so we might want a subdir or just prefix?
-            # Existing exporter for STL creates {name}_body.stl and {name}_text.stl. 
-            # So if we pass path/to/safe_name.stl, it does the right thing.
-            
-            ext = "step" if format == "step" else "stl"
-            label_output_path = output_dir / f"{safe_name}.{ext}"
-            
-            if generate_single_label(line, label_output_path, profile_face, format):
-                success_count += 1
+        used_names = set()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for line in lines:
+                safe_name = sanitize_filename(line)
+                # Lines that sanitize to the same name would have workers
+                # writing the same file at once, so give repeats a suffix
+                base_name, suffix = safe_name, 2
+                while safe_name in used_names:
+                    safe_name = f"{base_name}_{suffix}"
+                    suffix += 1
+                used_names.add(safe_name)
+                if safe_name != base_name:
+                    rprint(f"[yellow]Warning:[/yellow] \"{line}\" duplicates an earlier file name, writing it as {safe_name}")
+
+                # Existing exporter for STL creates {name}_body.stl and {name}_text.stl.
+                # So if we pass path/to/safe_name.stl, it does the right thing.
+                ext = "step" if format == "step" else "stl"
+                label_output_path = output_dir / f"{safe_name}.{ext}"
+
+                future = executor.submit(
+                    generate_single_label, line, label_output_path, profile, font, format
+                )
+                futures[future] = line
+
+            for future in as_completed(futures):
+                try:
+                    if future.result():
+                        success_count += 1
+                except BrokenProcessPool:
+                    # A worker died (e.g. crashed in OCCT); count the label as failed
+                    rprint(f"[bold red]Error generating label \"{futures[future]}\":[/bold red] worker process terminated")
         
         rprint(f"\n[bold green]Batch processing complete![/bold green] ({success_count}/{len(lines)} successful)")
         
     elif text:
         # Single label mode
-        if not generate_single_label(text, output, profile_face, format):
+        if not generate_single_label(text, output, profile, font, format):
             raise typer.Exit(code=1)
             
     else:
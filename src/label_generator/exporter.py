@@ -7,12 +7,15 @@ This module handles exporting the label assembly in various formats
 
 from pathlib import Path
 from build123d import Compound, export_step, export_stl, Color, Part
-from typing import Literal
+from typing import List, Literal, Tuple
 
 
 class LabelExporter:
     """Exports label assembly in multiple formats."""
 
+    BODY_COLOR = Color(0.2, 0.2, 0.2)
+    TEXT_COLOR = Color(1.0, 1.0, 1.0)
+
     def __init__(self, label_body: Part, text_insert: Part):
         """
         Initialize LabelExporter.
@@ -27,8 +30,8 @@ class LabelExporter:
         self.label_body.label = "label_body"
         self.text_insert.label = "text_insert"
 
-        self.label_body.color = Color(0.2, 0.2, 0.2)
-        self.text_insert.color = Color(1.0, 1.0, 1.0)
+        self.label_body.color = self.BODY_COLOR
+        self.text_insert.color = self.TEXT_COLOR
 
     def export(self, output_path: Path, format: Literal["step", "stl"] = "step") -> None:
         """
@@ -45,13 +48,24 @@ class LabelExporter:
         else:
             raise ValueError(f"Unsupported format: {format}")
 
-    def _export_step(self, output_path: Path) -> None:
-        """Export as single STEP file with multiple bodies."""
-        assembly = Compound(
-            label="toolbox_label",
+    def assembly(self, label: str = "toolbox_label") -> Compound:
+        """
+        Combine body and text insert into a labelled assembly.
+
+        Args:
+            label: Name of the assembly in the exported file
+
+        Returns:
+            Compound with the label body and text insert as children
+        """
+        return Compound(
+            label=label,
             children=[self.label_body, self.text_insert]
         )
-        export_step(assembly, str(output_path))
+
+    def _export_step(self, output_path: Path) -> None:
+        """Export as single STEP file with multiple bodies."""
+        export_step(self.assembly(), str(output_path))
 
     def _export_stl(self, output_path: Path) -> None:
         """Export as multiple STL files (one per body)."""
@@ -65,3 +79,31 @@ class LabelExporter:
 
         print(f"  Exported body: {body_path}")
         print(f"  Exported text: {text_path}")
+
+
+BATCH_SPACING = 5.0
+
+
+def export_batch_step(labels: List[Tuple[str, Part, Part]], output_path: Path) -> None:
+    """
+    Export many labels into a single STEP file.
+
+    Labels are laid out side by side along Y, BATCH_SPACING mm apart, each
+    as its own named sub-assembly.
+
+    Args:
+        labels: (name, label_body, text_insert) for each label
+        output_path: Path to output file
+    """
+    children = []
+    y_offset = 0.0
+    for name, label_body, text_insert in labels:
+        depth = label_body.bounding_box().size.Y
+        exporter = LabelExporter(
+            label_body.translate((0, y_offset, 0)),
+            text_insert.translate((0, y_offset, 0))
+        )
+        children.append(exporter.assembly(name))
+        y_offset += depth + BATCH_SPACING
+
+    export_step(Compound(label="batch", children=children), str(output_path))
@@ -1,134 +1,408 @@
 """
-Kerned Text Rendering using Inkscape
+Kerned Text Rendering using HarfBuzz
 
-This module uses Inkscape to render text to SVG paths, which are then
-imported using build123d.
+This module shapes text with HarfBuzz and builds build123d faces directly
+from HarfBuzz's glyph outlines, with exact line and Bezier edges.
 """
 
-import subprocess
-import tempfile
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import combinations
 from pathlib import Path
-from build123d import import_svg, Compound, Face, Wire
-from typing import List, Tuple
+from build123d import Compound, Edge, Face, Location, Vector, Wire
+from fontTools.pens.basePen import BasePen
+from fontTools.pens.recordingPen import RecordingPen, replayRecording
+from fontTools.ttLib import TTFont
+from typing import Dict, List, Optional, Tuple, Union
+import uharfbuzz as hb
+
+
+class _WirePen(BasePen):
+    """Pen that turns glyph contours into closed build123d wires, scaled to mm."""
+
+    TOLERANCE = 1e-6
+
+    def __init__(self, scale: float):
+        """
+        Initialize _WirePen.
+
+        Args:
+            scale: Font units to mm
+        """
+        super().__init__(glyphSet=None)
+        self.scale = scale
+        self.wires: List[Wire] = []
+        # Signed area of each wire's control polygon, its sign is the winding
+        self.areas: List[float] = []
+        self._edges: List[Edge] = []
+        self._area = 0.0
+        self._start = None
+        self._current = None
+
+    def _point(self, pt) -> Vector:
+        return Vector(pt[0] * self.scale, pt[1] * self.scale)
+
+    def _moveTo(self, pt):
+        self._start = self._current = self._point(pt)
+        self._area = 0.0
+
+    def _add_area(self, *points: Vector):
+        # Shoelace sum over the control polygon from the current point
+        prev = self._current
+        for pt in points:
+            self._area += prev.X * pt.Y - pt.X * prev.Y
+            prev = pt
+
+    def _lineTo(self, pt):
+        self._line_to(self._point(pt))
+
+    def _line_to(self, end: Vector):
+        # Skip zero-length segments, OCCT cannot build an edge from them
+        if (end - self._current).length > self.TOLERANCE:
+            self._edges.append(Edge.make_line(self._current, end))
+            self._add_area(end)
+            self._current = end
+
+    def _qCurveToOne(self, pt1, pt2):
+        ctrl, end = self._point(pt1), self._point(pt2)
+        self._edges.append(Edge.make_bezier(self._current, ctrl, end))
+        self._add_area(ctrl, end)
+        self._current = end
+
+    def _curveToOne(self, pt1, pt2, pt3):
+        ctrl1, ctrl2, end = self._point(pt1), self._point(pt2), self._point(pt3)
+        self._edges.append(Edge.make_bezier(self._current, ctrl1, ctrl2, end))
+        self._add_area(ctrl1, ctrl2, end)
+        self._current = end
+
+    def _closePath(self):
+        self._line_to(self._start)
+        if self._edges:
+            self.wires.append(Wire(self._edges))
+            self.areas.append(self._area / 2)
+        self._edges = []
+
+    def _endPath(self):
+        # Open contours enclose no area
+        self._edges = []
+
+
+@dataclass
+class FontContext:
+    """Parsed font state shared by every KernedText rendered with the same font."""
+
+    hb_blob: hb.Blob
+    units_per_em: int
+    ascent: int
+    descent: int
+    hb_face: hb.Face
+    hb_font: hb.Font
+    # glyph_id -> outline recording in font units
+    glyph_outline_cache: Dict[int, list] = field(default_factory=dict, repr=False)
+    # (text, letter spacing in font units) -> shape_text() result
+    shape_cache: Dict[Tuple[str, float], tuple] = field(default_factory=dict, repr=False)
+    # (glyph_id, font_size) -> glyph faces in mm at the origin
+    glyph_face_cache: Dict[Tuple[int, float], List[Face]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def load(cls, font_path: Path, weight: float = 700) -> 'FontContext':
+        """
+        Load a font file once so it can be reused across labels.
+
+        Args:
+            font_path: Path to a TTF/OTF font file
+            weight: Weight to select when the font is variable
+
+        Returns:
+            FontContext for the font
+        """
+        # HarfBuzz memory-maps the file itself, so the font is never copied
+        # into a bytes object up front
+        hb_blob = hb.Blob.from_file_path(str(font_path))
+        hb_face = hb.Face(hb_blob)
+        hb_font = hb.Font(hb_face)
+
+        # fontTools is only needed for a few header tables. With lazy=True
+        # nothing else is parsed, and the TTFont is closed once they are read
+        # rather than kept alive for the life of the process.
+        with TTFont(font_path, lazy=True) as ttfont:
+            units_per_em = ttfont['head'].unitsPerEm
+            hhea = ttfont['hhea']
+            has_wght = 'fvar' in ttfont and any(
+                axis.axisTag == 'wght' for axis in ttfont['fvar'].axes
+            )
+
+        # Shape and draw in font units; set once here rather than per call
+        hb_font.scale = (units_per_em, units_per_em)
+
+        # Variations set on the HarfBuzz font apply to shaping and outlines
+        if has_wght:
+            hb_font.set_variations({'wght': weight})
+
+        return cls(
+            hb_blob=hb_blob,
+            units_per_em=units_per_em,
+            ascent=hhea.ascent,
+            descent=hhea.descent,
+            hb_face=hb_face,
+            hb_font=hb_font,
+        )
+
+
+@lru_cache(maxsize=64)
+def load_font_context(font_path: Path) -> FontContext:
+    """
+    Load a font once per process and share it between all KernedText instances.
+
+    The returned FontContext also carries the glyph outline and face caches,
+    so every label rendered with the font reuses glyphs drawn for earlier ones.
+
+    Args:
+        font_path: Path to a TTF/OTF font file
+
+    Returns:
+        Cached FontContext for the font
+    """
+    return FontContext.load(font_path)
 
 
 class KernedText:
-    """Renders text by shelling out to Inkscape."""
+    """Renders kerned text from the font's glyph outlines."""
 
-    def __init__(self, text: str, font_size: float):
+    def __init__(
+        self,
+        text: str,
+        font_size: float,
+        font_path: Optional[Path] = None,
+        font_ctx: Optional[FontContext] = None,
+        letter_spacing: float = 0.0
+    ):
         """
         Initialize KernedText.
 
         Args:
             text: The text string to render
             font_size: Font size in mm
+            font_path: Font file to load when no font_ctx is given
+            font_ctx: Already-loaded font to share between labels
+            letter_spacing: Extra space between glyphs in mm (negative tightens)
         """
+        if font_ctx is None:
+            if font_path is None:
+                raise ValueError("KernedText needs either font_path or font_ctx")
+            font_ctx = load_font_context(Path(font_path))
+
         self.text = text
         self.font_size = font_size
+        self.letter_spacing = letter_spacing
+        self.font_ctx = font_ctx
+        self.units_per_em = font_ctx.units_per_em
+        self.hb_font = font_ctx.hb_font
+        self.width = None
+        self.height = None
 
-    def create_geometry(self) -> Compound:
+    def shape_text(self) -> Tuple[Tuple[Tuple[int, float, float], ...], float]:
         """
-        Create build123d geometry using Inkscape for rendering.
+        Shape the text with HarfBuzz to get kerned glyph positions.
+
+        letter_spacing is added after every glyph but the last, like CSS
+        letter-spacing. Results are cached on the FontContext, so the same
+        text is only shaped once per font and spacing.
 
         Returns:
-            Compound containing all glyph faces, centered at (0, 0)
+            Tuple of ((glyph_id, x, y), ...) and the total advance, in font units
         """
-        # Use temporary directory for intermediate files
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            source_svg = tmp_path / "source.svg"
-            outlined_svg = tmp_path / "outlined.svg"
+        spacing = self.letter_spacing * self.units_per_em / self.font_size
+        key = (self.text, spacing)
+        cached = self.font_ctx.shape_cache.get(key)
+        if cached is not None:
+            return cached
+
+        buf = hb.Buffer()
+        buf.add_str(self.text)
+        buf.guess_segment_properties()
+        hb.shape(self.hb_font, buf, {"kern": True, "liga": True})
+
+        infos = buf.glyph_infos
+        positions = buf.glyph_positions
 
-            # 1. Create source SVG with text
-            self._create_source_svg(source_svg)
+        # The glyph count is known after shaping, so fill a fixed-size list
+        shaped_glyphs = [None] * len(infos)
+        x_cursor = 0
+        y_cursor = 0
+        for i, (info, pos) in enumerate(zip(infos, positions)):
+            shaped_glyphs[i] = (
+                info.codepoint,
+                x_cursor + pos.x_offset,
+                y_cursor + pos.y_offset
+            )
+            x_cursor += pos.x_advance + spacing
+            y_cursor += pos.y_advance
+
+        if infos:
+            x_cursor -= spacing
+
+        result = self.font_ctx.shape_cache[key] = (tuple(shaped_glyphs), x_cursor)
+        return result
 
-            # 2. Run Inkscape to convert text to paths
-            self._run_inkscape(source_svg, outlined_svg)
+    def create_geometry(self) -> Union[Face, Compound]:
+        """
+        Create build123d geometry from the shaped glyph outlines.
 
-            # 3. Import the result
-            shapes = import_svg(str(outlined_svg))
+        Returns:
+            The glyph face, or a Compound of all glyph faces when there is
+            more than one, centered at (0, 0)
+        """
+        # 1. Shape the text to get kerned glyph positions
+        shaped_glyphs, advance = self.shape_text()
 
-        if len(shapes) == 0:
-            raise ValueError(f"No shapes imported from Inkscape SVG for text: {self.text}")
+        # Font units -> mm
+        scale_factor = self.font_size / self.units_per_em
 
-        # 4. Convert shapes to Faces
+        # 2. Work out the centering offset from the shaped advance and the
+        # font's line metrics rather than an OCCT bounding box pass
+        ascent = self.font_ctx.ascent
+        descent = self.font_ctx.descent
+        self.width = advance * scale_factor
+        self.height = (ascent - descent) * scale_factor
+        center_x = self.width / 2
+        center_y = (ascent + descent) / 2 * scale_factor
+
+        # 3. Place each glyph's faces, built on first use, at its centered, shaped position.
+        # moved() only sets a location, so repeated glyphs share the same
+        # underlying OCCT geometry instead of copying it.
         faces = []
-        for shape in shapes:
-            if isinstance(shape, Face):
-                faces.append(shape)
-            elif isinstance(shape, Wire):
-                faces.append(Face(shape))
-        
+        for glyph_id, x_pos, y_pos in shaped_glyphs:
+            location = Location((
+                x_pos * scale_factor - center_x,
+                y_pos * scale_factor - center_y,
+                0
+            ))
+            for face in self._glyph_faces(glyph_id):
+                faces.append(face.moved(location))
+
         if not faces:
-            raise ValueError(f"No faces created from Inkscape SVG for text: {self.text}")
-
-        # 5. Create Compound and center
-        result = Compound(faces)
-        
-        # Inkscape exports in pixels (96 DPI). Convert to mm.
-        # 1 inch = 25.4 mm = 96 px
-        # Scale factor = 25.4 / 96
-        PX_TO_MM = 25.4 / 96.0
-        
-        # Scale down to mm
-        result = result.scale(PX_TO_MM)
-        
-        # Center the text at origin
-        bbox = result.bounding_box()
-        center_x = (bbox.min.X + bbox.max.X) / 2
-        center_y = (bbox.min.Y + bbox.max.Y) / 2
-        
-        centered = result.translate((-center_x, -center_y, 0))
-
-        return centered
-
-    def _create_source_svg(self, path: Path):
-        """Write the source SVG with <text> element."""
-        
-        # Use a viewBox that comfortably fits text. 
-        # Inkscape will handle the bounds during export usually, but giving it created text is fine.
-        # We assume standard pixels for SVG (96 DPI).
-        # We want font_size in mm. SVG 'font-size' without units is user units (pixels).
-        # 1 mm = 3.7795 px.
-        # However, build123d import_svg assumes 1 unit = 1 mm if strictly following some conventions?
-        # Actually build123d import_svg reads units.
-        # Let's be explicit with units in SVG.
-        
-        svg = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="500mm" height="200mm" viewBox="0 0 500 200">
-  <defs>
-    <style type="text/css">
-      @font-face {{
-        font-family: 'Inter';
-        font-weight: bold;
-      }}
-    </style>
-  </defs>
-  <text x="10" y="100" font-family="Inter" font-weight="bold" font-size="{self.font_size}mm" fill="black" style="text-rendering: optimizeLegibility; font-feature-settings: 'kern'; letter-spacing: -2px;">{self.text}</text>
-</svg>'''
-        
-        with open(path, 'w') as f:
-            f.write(svg)
-
-    def _run_inkscape(self, input_path: Path, output_path: Path):
-        """Run Inkscape CLI to convert text to paths."""
-        # Inkscape 1.0+ command line options
-        # --export-type=svg --export-text-to-path --export-filename=...
-        
-        cmd = [
-            "inkscape",
-            f"--export-filename={str(output_path)}",
-            "--export-type=svg",
-            "--export-text-to-path",
-            str(input_path)
+            raise ValueError(f"No faces created from glyph outlines for text: {self.text}")
+
+        # A lone face needs no Compound wrapper; Face.faces() still works downstream
+        if len(faces) == 1:
+            return faces[0]
+        return Compound(faces)
+
+    def _glyph_outline(self, glyph_id: int) -> list:
+        """
+        Get the outline of a glyph in font units, recording it on first use.
+
+        Outlines come from HarfBuzz's draw API, which applies the font's
+        variations and flattens composite glyphs.
+        """
+        cache = self.font_ctx.glyph_outline_cache
+        outline = cache.get(glyph_id)
+        if outline is None:
+            pen = RecordingPen()
+            self.hb_font.draw_glyph_with_pen(glyph_id, pen)
+            outline = cache[glyph_id] = pen.value
+        return outline
+
+    def _glyph_faces(self, glyph_id: int) -> List[Face]:
+        """
+        Get the faces of a single glyph at the origin, building them on first use.
+
+        Args:
+            glyph_id: Glyph ID in the font
+
+        Returns:
+            List of faces in mm (empty for whitespace glyphs)
+        """
+        key = (glyph_id, self.font_size)
+        cache = self.font_ctx.glyph_face_cache
+        if key in cache:
+            return cache[key]
+
+        pen = _WirePen(self.font_size / self.units_per_em)
+        replayRecording(self._glyph_outline(glyph_id), pen)
+
+        # Whitespace glyphs have no contours
+        faces = self._faces_from_wires(pen.wires, pen.areas)
+
+        cache[key] = faces
+        return faces
+
+    @staticmethod
+    def _faces_from_wires(wires: List[Wire], areas: List[float]) -> List[Face]:
+        """
+        Build faces from closed glyph contours.
+
+        Contours are classified by winding: those wound like the largest
+        contour are outer boundaries, the rest are holes. Each hole is cut
+        from the smallest outer contour that really encloses it, confirmed
+        by testing every vertex and edge midpoint of the hole against the
+        outer face rather than bounding boxes alone, so
+        overlapping strokes (the slash in 'Ø', '%') are not mistaken for
+        holes. Glyphs whose outer faces are disjoint, like 'o', 'a' and 'B',
+        need no boolean operations. When faces overlap, or a hole has no
+        enclosing contour, the faces are fused and stray holes cut in one
+        boolean pass each.
+
+        Args:
+            wires: Closed contours of one glyph
+            areas: Signed area of each contour
+
+        Returns:
+            List of faces with holes
+        """
+        if not wires:
+            return []
+
+        outer_sign = areas[max(range(len(areas)), key=lambda i: abs(areas[i]))] > 0
+        outers = [i for i, area in enumerate(areas) if (area > 0) == outer_sign]
+        boxes = [wire.bounding_box() for wire in wires]
+        outer_faces = {i: Face(wires[i]) for i in outers}
+
+        # Every vertex and edge midpoint of each contour; a single point can
+        # land inside an overlapping stroke that does not enclose the hole
+        samples = [
+            [edge.position_at(t) for edge in wire.edges() for t in (0.0, 0.5)]
+            for wire in wires
+        ]
+
+        def encloses(outer: int, inner: int) -> bool:
+            a, b = boxes[outer], boxes[inner]
+            return (
+                a.min.X <= b.min.X and a.min.Y <= b.min.Y
+                and a.max.X >= b.max.X and a.max.Y >= b.max.Y
+                and all(outer_faces[outer].is_inside(pt) for pt in samples[inner])
+            )
+
+        holes = {i: [] for i in outers}
+        stray_holes = []
+        for i in range(len(wires)):
+            if i in holes:
+                continue
+            parents = [j for j in outers if encloses(j, i)]
+            if parents:
+                parent = min(parents, key=lambda j: abs(areas[j]))
+                holes[parent].append(wires[i])
+            else:
+                stray_holes.append(Face(wires[i]))
+
+        faces = [
+            Face(wires[i], inner_wires=inner) if inner else outer_faces[i]
+            for i, inner in holes.items()
         ]
-        
-        try:
-            result = subprocess.run(
-                cmd, 
-                check=True, 
-                capture_output=True, 
-                text=True
+
+        def overlaps(i: int, j: int) -> bool:
+            a, b = boxes[i], boxes[j]
+            return (
+                a.min.X < b.max.X and b.min.X < a.max.X
+                and a.min.Y < b.max.Y and b.min.Y < a.max.Y
             )
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Inkscape failed: {e.stderr}")
+
+        overlapping = any(overlaps(i, j) for i, j in combinations(outers, 2))
+        if not overlapping and not stray_holes:
+            return faces
+
+        shape = faces[0].fuse(*faces[1:]) if len(faces) > 1 else faces[0]
+        if stray_holes:
+            shape = shape.cut(*stray_holes)
+        return shape.clean().faces()
@@ -8,9 +8,10 @@ This module handles the 3D assembly of the label:
 - Generating text insert bodies
 """
 
+from typing import Tuple, Union
 from build123d import (
-    BuildPart, BuildSketch, Plane, Axis, SortBy, Location,
-    extrude, Mode, Compound, Face, Solid, add
+    BuildPart, BuildSketch, Plane, Axis,
+    extrude, Mode, Compound, Face, Sketch, add
 )
 
 
@@ -20,23 +21,34 @@ class LabelBuilder:
     FRONT_FACE_LENGTH = 27.5
     TOLERANCE = 1.0
 
-    def __init__(self, profile: Face, text_geometry: Compound, label_width: float, text_depth: float = 0.8):
+    def __init__(
+        self,
+        profile: Face,
+        text_geometry: Union[Face, Compound],
+        label_width: float,
+        text_depth: float = 0.8,
+        text_is_clean: bool = False
+    ):
         """
         Initialize LabelBuilder.
 
         Args:
             profile: Scaled Face in Y-Z plane
-            text_geometry: Text Compound from LabelText
+            text_geometry: Text Face or Compound from LabelText
             label_width: Total width for extrusion
             text_depth: Depth to recess text (default 0.8mm)
+            text_is_clean: Every text face was checked valid, so skip healing
         """
         self.profile = profile
         self.text_geometry = text_geometry
         self.label_width = label_width
         self.text_depth = text_depth
+        self.text_is_clean = text_is_clean
         self.label_body = None
         self.text_insert = None
+        self._front_face = None
         self._sketch_plane = None
+        self._text_sketch = None
 
     def build_body(self) -> 'LabelBuilder':
         """
@@ -62,9 +74,14 @@ class LabelBuilder:
         - Contains an edge approximately 27.5mm long
         - Largest area among candidates
 
+        The result is memoized so the recess and insert steps share one face.
+
         Returns:
             The front face as a Face object
         """
+        if self._front_face is not None:
+            return self._front_face
+
         faces = self.label_body.faces()
 
         candidate_faces = []
@@ -83,8 +100,8 @@ class LabelBuilder:
                 f"Could not find planar front face with edge length ~{self.FRONT_FACE_LENGTH}mm"
             )
 
-        front_face = sorted(candidate_faces, key=lambda f: f.area, reverse=True)[0]
-        return front_face
+        self._front_face = max(candidate_faces, key=lambda f: f.area)
+        return self._front_face
 
     def _get_sketch_plane(self) -> Plane:
         """
@@ -99,29 +116,56 @@ class LabelBuilder:
             )
         return self._sketch_plane
 
-    def add_text_recess(self) -> 'LabelBuilder':
+    def _prepare_text_sketch(self) -> Tuple[Plane, Sketch]:
         """
-        Cut recessed text into front face.
+        Get the sketch plane and the text sketch placed on it.
+
+        Shared by add_text_recess and create_text_insert and memoized, so
+        the rotate/clean/fix work and the fuse of all glyph faces into one
+        sketch are only done once per label. Healing is skipped only when
+        the caller has checked that every text face is valid.
 
         Returns:
-            Self for method chaining
+            Tuple of (sketch plane, text sketch)
         """
-        sketch_plane = self._get_sketch_plane()
+        if self._text_sketch is None:
+            sketch_plane = self._get_sketch_plane()
+
+            rotated_text = self.text_geometry.rotate(Axis.Z, 90)
 
-        rotated_text = self.text_geometry.rotate(Axis.Z, 90)
+            if self.text_is_clean:
+                text_faces = rotated_text.faces()
+            else:
+                cleaned_text = rotated_text.clean().fix()
+                text_faces = [face.fix() for face in cleaned_text.faces()]
 
-        cleaned_text = rotated_text.clean().fix()
+            with BuildSketch(sketch_plane) as sketch:
+                # A single add() fuses all glyphs in one boolean operation
+                # instead of one fuse per face
+                add(text_faces)
 
-        text_faces = cleaned_text.faces()
+            self._text_sketch = (sketch_plane, sketch.sketch)
+        return self._text_sketch
+
+    def add_text_recess(self) -> 'LabelBuilder':
+        """
+        Cut recessed text into front face.
+
+        Returns:
+            Self for method chaining
+        """
+        sketch_plane, text_sketch = self._prepare_text_sketch()
 
         extrude_depth = -(self.text_depth + 0.1)
 
         with BuildPart() as part:
             add(self.label_body)
-            with BuildSketch(sketch_plane):
-                for face in text_faces:
-                    add(face.fix())
-            extrude(amount=extrude_depth, mode=Mode.SUBTRACT)
+            extrude(
+                text_sketch,
+                amount=extrude_depth,
+                dir=sketch_plane.z_dir,
+                mode=Mode.SUBTRACT
+            )
 
         self.label_body = part.part
         return self
@@ -133,19 +177,10 @@ class LabelBuilder:
         Returns:
             Self for method chaining
         """
-        sketch_plane = self._get_sketch_plane()
-
-        rotated_text = self.text_geometry.rotate(Axis.Z, 90)
-
-        cleaned_text = rotated_text.clean().fix()
-
-        text_faces = cleaned_text.faces()
+        sketch_plane, text_sketch = self._prepare_text_sketch()
 
         with BuildPart() as insert:
-            with BuildSketch(sketch_plane):
-                for face in text_faces:
-                    add(face.fix())
-            extrude(amount=-self.text_depth)
+            extrude(text_sketch, amount=-self.text_depth, dir=sketch_plane.z_dir)
 
         self.text_insert = insert.part
         return self
@@ -62,18 +62,10 @@ class ClipProfile:
             raise ValueError("Must call load() before scale_to_dimensions()")
 
         bbox = self.raw_shape.bounding_box()
-        current_width = bbox.size.X
-        current_height = bbox.size.Y
-
-        scale_factor = self.TARGET_HEIGHT / current_height
-
-        print(f"SVG scale factor: {scale_factor:.6f}")
-        print(f"  Original: {current_width:.2f} x {current_height:.2f}")
-        print(f"  Scaled: {current_width * scale_factor:.2f} x {current_height * scale_factor:.2f}")
+        scale_factor = self.TARGET_HEIGHT / bbox.size.Y
 
         scaled = scale(self.raw_shape, by=(scale_factor, scale_factor, 1.0))
 
-        rotated = scaled.rotate(Axis.Y, 90)
-
-        self.scaled_face = rotated
+        # Rotate to Y-Z plane
+        self.scaled_face = scaled.rotate(Axis.Y, 90)
         return self.scaled_face
@@ -5,41 +5,51 @@ This module handles creating 3D text geometry from the label text string
 using the specified font with proper kerning via HarfBuzz.
 """
 
-from pathlib import Path
-from build123d import Compound
-from .kerned_text import KernedText
+from typing import Union
+from build123d import Compound, Face
+from .kerned_text import FontContext, KernedText
 
 
 class LabelText:
     """Creates 3D text geometry for the label with proper kerning."""
 
     FONT_SIZE = 16.0
+    # Tightened tracking, -2px at 96 DPI
+    LETTER_SPACING = -2 * 25.4 / 96
     RECESS_DEPTH = 0.8
     PADDING = 20.0
 
-    def __init__(self, text: str):
+    def __init__(self, text: str, font_ctx: FontContext):
         """
         Initialize LabelText.
 
         Args:
             text: The text string to render
+            font_ctx: Font to render with, loaded by the caller
         """
         self.text = text
+        self.font_ctx = font_ctx
         self.text_geometry = None
         self.text_width = None
+        self.text_is_clean = False
 
-    def create_text(self) -> Compound:
+    def create_text(self) -> Union[Face, Compound]:
         """
         Generate 2D text geometry with proper kerning.
 
         Returns:
-            Compound containing the text geometry
+            Face or Compound containing the text geometry
         """
-        kerned = KernedText(self.text, self.FONT_SIZE)
+        kerned = KernedText(
+            self.text,
+            self.FONT_SIZE,
+            font_ctx=self.font_ctx,
+            letter_spacing=self.LETTER_SPACING
+        )
         self.text_geometry = kerned.create_geometry()
-
-        bbox = self.text_geometry.bounding_box()
-        self.text_width = bbox.size.X
+        self.text_width = kerned.width
+        # Only skip healing downstream when every face checks out as valid
+        self.text_is_clean = all(face.is_valid for face in self.text_geometry.faces())
 
         return self.text_geometry
 